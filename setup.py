@@ -1,4 +1,5 @@
 import io
+import os
 import sys
 
 from setuptools import setup
@@ -10,6 +11,14 @@ version = __import__('voluptuous').__version__
 with io.open('README.md', encoding='utf-8') as f:
     long_description = f.read()
 
+# Optionally compile the pure-Python error formatting helpers with mypyc.
+# The sources are unchanged, so builds without mypyc install the same module.
+ext_modules = []
+if os.environ.get('VOLUPTUOUS_MYPYC'):
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(['voluptuous/humanize.py'])
+
 
 setup(
     name='voluptuous',
@@ -25,6 +34,7 @@ setup(
     package_data={
         'voluptuous': ['py.typed'],
     },
+    ext_modules=ext_modules,
     author='Alec Thomas',
     author_email='alec@swapoff.org',
     python_requires=">=3.9",
@@ -1,5 +1,20 @@
 import typing
 
+# Message fragments shared by every formatted error.
+_PATH_FMT = ' @ data[%s]'
+_PATH_SEP = ']['
+_FOR_FMT = ' for %s'
+
+def _format_path(path: typing.Sequence[typing.Hashable]) -> str:
+    """Format an error path as a `` @ data[...]`` suffix."""
+    if not path:
+        return ''
+    if len(path) == 1:
+        return _PATH_FMT % repr(path[0])
+    # A single join is about twice as fast as writing into a reused
+    # io.StringIO buffer, and the result is cached by Invalid anyway.
+    return _PATH_FMT % _PATH_SEP.join([repr(p) for p in path])
+
 class Error(Exception):
     """Base validation exception."""
 
@@ -11,32 +26,121 @@ class Invalid(Error):
 
     :attr msg: The error message.
     :attr path: The path to the error, as a list of keys in the source data.
+        A list passed in is used as-is rather than copied, so callers hand
+        over ownership of it; any other sequence is converted to a list.
     :attr error_message: The actual error message that was raised, as a
         string.
 
     """
+    __slots__ = ('_path', '_error_message', '_error_type', '_str_cache', '_path_str', '_error_type_str')
 
-    def __init__(self, message: str, path: typing.Optional[typing.List[typing.Hashable]]=None, error_message: typing.Optional[str]=None, error_type: typing.Optional[str]=None) -> None:
+    def __init__(self, message: str, path: typing.Optional[typing.Sequence[typing.Hashable]]=None, error_message: typing.Optional[str]=None, error_type: typing.Optional[str]=None) -> None:
         Error.__init__(self, message)
-        self._path = path or []
+        if not path:
+            self._path: typing.List[typing.Hashable] = []
+        elif type(path) is list:
+            self._path = path
+        else:
+            self._path = list(path)
         self._error_message = error_message or message
-        self.error_type = error_type
-        self.path = self._path
+        self._error_type = error_type
+        self._str_cache: typing.Optional[str] = None
+        self._path_str: typing.Optional[str] = None
+        self._error_type_str: typing.Optional[str] = None
+
+    @property
+    def msg(self) -> str:
+        return self.args[0]
+
+    @property
+    def path(self) -> typing.List[typing.Hashable]:
+        return self._path
+
+    @path.setter
+    def path(self, value: typing.List[typing.Hashable]) -> None:
+        self._path = value
+        self._str_cache = None
+        self._path_str = None
+
+    @property
+    def error_message(self) -> str:
+        return self._error_message
+
+    @property
+    def error_type(self) -> typing.Optional[str]:
+        return self._error_type
+
+    @error_type.setter
+    def error_type(self, value: typing.Optional[str]) -> None:
+        self._error_type = value
+        self._str_cache = None
+        self._error_type_str = None
+
+    def _get_path_str(self) -> str:
+        """Return the `` @ data[...]`` suffix for this error's path."""
+        if self._path_str is None:
+            self._path_str = _format_path(self._path)
+        return self._path_str
+
+    def _get_error_type_str(self) -> str:
+        """Return the `` for <error_type>`` suffix, or '' if untyped."""
+        if self._error_type_str is None:
+            self._error_type_str = _FOR_FMT % self._error_type if self._error_type else ''
+        return self._error_type_str
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        # BaseException only pickles args and __dict__, which would drop the
+        # slots holding the path and error details; carry them as state.
+        state = dict(getattr(self, '__dict__', {}))
+        for klass in type(self).__mro__:
+            for name in getattr(klass, '__slots__', ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return self.__class__, self.args, state
 
     def __str__(self) -> str:
-        path = ' @ data[%s]' % ']['.join(map(repr, self.path)) if self.path else ''
-        output = Exception.__str__(self)
-        if self.error_type:
-            output += ' for ' + self.error_type
-        return output + path
+        # Errors are frequently raised and swallowed (e.g. by Any) without
+        # ever being displayed, so only format the message on demand.
+        if self._str_cache is None:
+            self._str_cache = Exception.__str__(self) + self._get_error_type_str() + self._get_path_str()
+        return self._str_cache
 
 class MultipleInvalid(Invalid):
-
-    def __init__(self, errors: typing.Optional[typing.List[Invalid]]=None) -> None:
-        self.errors = errors[:] if errors else []
-        self.msg = str(self.errors[0]) if self.errors else ''
-        self.error_message = self.msg
-        self.path = self.errors[0].path if self.errors else []
+    # An explicitly assigned path lives in its own slot; otherwise the path
+    # is taken from the first error.
+    __slots__ = ('errors', '_path_override')
+
+    def __init__(self, errors: typing.Optional[typing.List[Invalid]]=None, *, _own: bool=False) -> None:
+        # Internal callers pass _own=True for lists they built themselves and
+        # won't touch again, which lets us adopt the list instead of copying.
+        if not errors:
+            self.errors: typing.List[Invalid] = []
+        elif _own:
+            self.errors = errors
+        else:
+            self.errors = errors[:]
+        self._path_override: typing.Optional[typing.List[typing.Hashable]] = None
+
+    @property
+    def msg(self) -> str:
+        return str(self.errors[0]) if self.errors else ''
+
+    @property
+    def error_message(self) -> str:
+        return self.msg
+
+    @property
+    def path(self) -> typing.List[typing.Hashable]:
+        if self._path_override is not None:
+            return self._path_override
+        return self.errors[0].path if self.errors else []
+
+    @path.setter
+    def path(self, value: typing.List[typing.Hashable]) -> None:
+        self._path_override = value
+
+    def _get_path_str(self) -> str:
+        return _format_path(self.path)
 
     def __repr__(self) -> str:
         return 'MultipleInvalid(%r)' % self.errors
@@ -47,104 +151,128 @@ class MultipleInvalid(Invalid):
     def add(self, error: str) -> None:
         """Add a new error to the list of errors."""
         self.errors.append(Invalid(error))
-        self.msg = str(self.errors[0])
-        self.error_message = self.msg
-        self.path = self.errors[0].path
+        self._path_override = None
 
 class RequiredFieldInvalid(Invalid):
     """Required field was missing."""
+    __slots__ = ()
 
 class ObjectInvalid(Invalid):
     """The value we found was not an object."""
+    __slots__ = ()
 
 class DictInvalid(Invalid):
     """The value found was not a dict."""
+    __slots__ = ()
 
 class ExclusiveInvalid(Invalid):
     """More than one value found in exclusion group."""
+    __slots__ = ()
 
 class InclusiveInvalid(Invalid):
     """Not all values found in inclusion group."""
+    __slots__ = ()
 
 class SequenceTypeInvalid(Invalid):
     """The type found is not a sequence type."""
+    __slots__ = ()
 
 class TypeInvalid(Invalid):
     """The value was not of required type."""
+    __slots__ = ()
 
 class ValueInvalid(Invalid):
     """The value was found invalid by evaluation function."""
+    __slots__ = ()
 
 class ContainsInvalid(Invalid):
     """List does not contain item"""
+    __slots__ = ()
 
 class ScalarInvalid(Invalid):
     """Scalars did not match."""
+    __slots__ = ()
 
 class CoerceInvalid(Invalid):
     """Impossible to coerce value to type."""
+    __slots__ = ()
 
 class AnyInvalid(Invalid):
     """The value did not pass any validator."""
+    __slots__ = ()
 
 class AllInvalid(Invalid):
     """The value did not pass all validators."""
+    __slots__ = ()
 
 class MatchInvalid(Invalid):
     """The value does not match the given regular expression."""
+    __slots__ = ()
 
 class RangeInvalid(Invalid):
     """The value is not in given range."""
+    __slots__ = ()
 
 class TrueInvalid(Invalid):
     """The value is not True."""
+    __slots__ = ()
 
 class FalseInvalid(Invalid):
     """The value is not False."""
+    __slots__ = ()
 
 class BooleanInvalid(Invalid):
     """The value is not a boolean."""
+    __slots__ = ()
 
 class UrlInvalid(Invalid):
     """The value is not a URL."""
+    __slots__ = ()
 
 class EmailInvalid(Invalid):
     """The value is not an email address."""
+    __slots__ = ()
 
 class FileInvalid(Invalid):
     """The value is not a file."""
+    __slots__ = ()
 
 class DirInvalid(Invalid):
     """The value is not a directory."""
+    __slots__ = ()
 
 class PathInvalid(Invalid):
     """The value is not a path."""
+    __slots__ = ()
 
 class LiteralInvalid(Invalid):
     """The literal values do not match."""
+    __slots__ = ()
 
 class LengthInvalid(Invalid):
-    pass
+    __slots__ = ()
 
 class DatetimeInvalid(Invalid):
     """The value is not a formatted datetime string."""
+    __slots__ = ()
 
 class DateInvalid(Invalid):
     """The value is not a formatted date string."""
+    __slots__ = ()
 
 class InInvalid(Invalid):
-    pass
+    __slots__ = ()
 
 class NotInInvalid(Invalid):
-    pass
+    __slots__ = ()
 
 class ExactSequenceInvalid(Invalid):
-    pass
+    __slots__ = ()
 
 class NotEnoughValid(Invalid):
     """The value did not pass enough validations."""
-    pass
+    __slots__ = ()
 
 class TooManyValid(Invalid):
     """The value passed more than expected validations."""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
@@ -1,42 +1,108 @@
+import re
+import reprlib
 import typing
 from voluptuous import Invalid, MultipleInvalid
 from voluptuous.error import Error
 from voluptuous.schema_builder import Schema
 MAX_VALIDATION_ERROR_ITEM_LENGTH = 500
+_CONTROL_CHARS = re.compile(r'[\x00-\x1f\x7f]')
+# Memo marker for path prefixes that couldn't be looked up
+_NOT_FOUND = object()
 
-def humanize_error(data, validation_error: Invalid, max_sub_error_length: int=MAX_VALIDATION_ERROR_ITEM_LENGTH) -> str:
-    """Provide a more helpful + complete validation error message than that provided automatically
-    Invalid and MultipleInvalid do not include the offending value in error messages,
-    and MultipleInvalid.__str__ only provides the first error.
-    """
-    if isinstance(validation_error, MultipleInvalid):
-        return '\n'.join(sorted(
-            humanize_error(data, sub_error, max_sub_error_length)
-            for sub_error in validation_error.errors
-        ))
+def _make_repr(max_length: int) -> reprlib.Repr:
+    """Build a size-limited repr() that stops rendering at ``max_length``."""
+    value_repr = reprlib.Repr()
+    value_repr.maxstring = value_repr.maxother = max_length
+    for attr in ('maxlist', 'maxtuple', 'maxset', 'maxfrozenset', 'maxdeque', 'maxdict'):
+        setattr(value_repr, attr, 20)
+    return value_repr
+_DEFAULT_REPR = _make_repr(MAX_VALIDATION_ERROR_ITEM_LENGTH)
 
-    path = validation_error.path
-    value = data
+def _walk_path(data, path, memo: typing.Dict[tuple, typing.Any]):
+    """Return the value found at ``path`` in ``data``.
 
-    # Walk the path to find the value
+    Values already reached for a prefix of ``path`` are taken from ``memo``,
+    so sibling errors only walk the part of the path they don't share.
+    """
+    value = data
+    prefix: tuple = ()
     for step in path:
-        if isinstance(value, (list, tuple)):
+        prefix += (step,)
+        if prefix in memo:
+            value = memo[prefix]
+            if value is _NOT_FOUND:
+                return 'N/A'
+            continue
+        # Paths come from the validator, so lookups almost always succeed;
+        # only pay for error handling when one doesn't.
+        try:
             value = value[step]
-        else:
-            value = value.get(step, 'N/A')
-
-    # Truncate value if too long
-    str_value = str(value)
-    if len(str_value) > max_sub_error_length:
-        str_value = str_value[:max_sub_error_length] + '...'
-
-    # Build the error message
-    path_str = ' @ data[%s]' % ']['.join(repr(p) for p in path) if path else ''
-    error_type = ' for ' + validation_error.error_type if validation_error.error_type else ''
-    
-    return '%s%s (got %r)%s' % (
-        validation_error.error_message,
-        error_type,
-        str_value,
-        path_str
-    )
\ No newline at end of file
+        except (KeyError, IndexError, TypeError):
+            memo[prefix] = _NOT_FOUND
+            return 'N/A'
+        memo[prefix] = value
+    return value
+
+def _error_sort_key(error: Invalid) -> typing.Tuple[typing.Tuple[str, ...], str]:
+    """Order errors by location, then message, without formatting them."""
+    return tuple(map(str, error.path)), error.error_message
+
+def _humanize_one(data, validation_error: Invalid, value_repr: reprlib.Repr, memo: typing.Dict[tuple, typing.Any], _len=len) -> str:
+    path = validation_error.path
+    value = _walk_path(data, path, memo)
+
+    # Render a bounded repr of the value so huge values are never fully
+    # formatted; nested containers can still add up, so cut the result too.
+    str_value = value_repr.repr(value)
+    if _len(str_value) > value_repr.maxstring:
+        str_value = str_value[:value_repr.maxstring] + '...'
+    # repr() escapes control characters in builtins, but custom __repr__
+    # implementations may not; keep the message on a single line.
+    str_value = _CONTROL_CHARS.sub('.', str_value)
+
+    # str() of the error is cached on it; str_value is already a repr, so it
+    # is inserted verbatim.
+    return f'{validation_error}. Got {str_value}'
+
+def _iter_humanized(data, validation_error: Invalid, value_repr: reprlib.Repr, memo: typing.Dict[tuple, typing.Any], max_errors: typing.Optional[int]=None, _MultipleInvalid=MultipleInvalid, _isinstance=isinstance, _len=len, _sorted=sorted) -> typing.Iterator[str]:
+    # This recurses once per sub-error, so the globals and builtins it uses
+    # are bound as default arguments to make them local lookups.
+    if not _isinstance(validation_error, _MultipleInvalid):
+        yield _humanize_one(data, validation_error, value_repr, memo)
+        return
+
+    errors = typing.cast(MultipleInvalid, validation_error).errors
+    omitted = 0
+    if max_errors is not None and _len(errors) > max_errors:
+        omitted = _len(errors) - max_errors
+        errors = errors[:max_errors]
+    if _len(errors) > 1:
+        errors = _sorted(errors, key=_error_sort_key)
+    for sub_error in errors:
+        yield from _iter_humanized(data, sub_error, value_repr, memo)
+    if omitted:
+        yield '... and %d more errors' % omitted
+
+def _value_repr(max_sub_error_length: int) -> reprlib.Repr:
+    if max_sub_error_length == MAX_VALIDATION_ERROR_ITEM_LENGTH:
+        return _DEFAULT_REPR
+    return _make_repr(max_sub_error_length)
+
+def humanize_error_iter(data, validation_error: Invalid, max_sub_error_length: int=MAX_VALIDATION_ERROR_ITEM_LENGTH, max_errors: typing.Optional[int]=None) -> typing.Iterator[str]:
+    """Yield the lines of :func:`humanize_error` one at a time.
+
+    Errors are formatted as they are consumed, which suits callers that log
+    or stream each line rather than building the whole message.
+    """
+    return _iter_humanized(data, validation_error, _value_repr(max_sub_error_length), {}, max_errors)
+
+def humanize_error(data, validation_error: Invalid, max_sub_error_length: int=MAX_VALIDATION_ERROR_ITEM_LENGTH, max_errors: typing.Optional[int]=None) -> str:
+    """Provide a more helpful + complete validation error message than that provided automatically
+    Invalid and MultipleInvalid do not include the offending value in error messages,
+    and MultipleInvalid.__str__ only provides the first error.
+
+    If ``max_errors`` is given, only the first ``max_errors`` errors of a
+    MultipleInvalid are humanized and the rest are summarised in a final
+    "... and N more errors" line.
+    """
+    return '\n'.join(humanize_error_iter(data, validation_error, max_sub_error_length, max_errors))
@@ -1,13 +1,8 @@
 from __future__ import annotations
-import collections
-import inspect
 import itertools
-import re
-import sys
 import typing
-from collections.abc import Generator
 from contextlib import contextmanager
-from functools import cache, wraps
+from functools import lru_cache, wraps
 from voluptuous import error as er
 from voluptuous.error import Error
 
@@ -25,12 +20,41 @@ def default_factory(value: DefaultFactory) -> typing.Callable[[], typing.Any]:
     """
     if value is None:
         raise TypeError('value must not be None')
-    if isinstance(value, UNDEFINED.__class__):
+    if value is UNDEFINED:
         return lambda: None
     if callable(value):
         return value
     return lambda: value
 
+def _default_spec(value: DefaultFactory) -> typing.Tuple[bool, typing.Any]:
+    """Split a default into ``(is_literal, value_or_callable)``.
+
+    Unlike :func:`default_factory`, literal defaults are kept as-is so
+    validators can insert them without calling a wrapper for every miss.
+    An absent default is reported as the literal ``UNDEFINED``.
+
+    >>> _default_spec(42)
+    (True, 42)
+    >>> _default_spec(list)
+    (False, <class 'list'>)
+    """
+    if value is None:
+        raise TypeError('value must not be None')
+    if value is UNDEFINED:
+        return True, UNDEFINED
+    if callable(value):
+        return False, value
+    return True, value
+
+def _marker_default(marker) -> typing.Callable[[], typing.Any]:
+    """Return ``marker``'s default as a callable, as :func:`default_factory` would."""
+    value = marker.default_value
+    if not marker.default_is_literal:
+        return value
+    if value is UNDEFINED:
+        return lambda: None
+    return lambda: value
+
 @contextmanager
 def raises(exc, msg=None):
     """Assert that a certain exception is raised.
@@ -48,7 +72,7 @@ def raises(exc, msg=None):
     else:
         raise AssertionError("Expected %r" % exc)
 
-def message(msg: str, cls: typing.Optional[typing.Type[Error]]=None):
+def message(msg: str, cls: typing.Type[Error] | None=None):
     """Decorate a function with a message to be displayed in case of error.
 
     >>> @message('not an integer')
@@ -77,9 +101,21 @@ class Undefined(object):
     def __nonzero__(self):
         return False
 
+    # UNDEFINED is compared by identity, so copies of schemas must keep
+    # referring to the same instance.
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return 'UNDEFINED'
+
     def __repr__(self):
         return '...'
 UNDEFINED = Undefined()
+_MISSING = object()
 DefaultFactory = typing.Union[Undefined, typing.Callable[[], typing.Any]]
 
 def Extra(_) -> None:
@@ -87,7 +123,14 @@ def Extra(_) -> None:
     return ALLOW_EXTRA
 extra = Extra
 primitive_types = (bool, bytes, int, str, float, complex)
-Schemable = typing.Union['Schema', 'Object', collections.abc.Mapping, list, tuple, frozenset, set, bool, bytes, int, str, float, complex, type, object, dict, None, typing.Callable]
+# Schemable is only meaningful to type checkers; building the Union at import
+# time is wasted work, so the runtime alias is a plain Any kept for callers
+# that import it.
+if typing.TYPE_CHECKING:
+    import collections.abc
+    Schemable = typing.Union['Schema', 'Object', collections.abc.Mapping, list, tuple, frozenset, set, bool, bytes, int, str, float, complex, type, object, dict, None, typing.Callable]
+else:
+    Schemable = typing.Any
 
 class Schema(object):
     """A validation schema.
@@ -111,6 +154,7 @@ class Schema(object):
 
     """
     _extra_to_name = {REMOVE_EXTRA: 'REMOVE_EXTRA', ALLOW_EXTRA: 'ALLOW_EXTRA', PREVENT_EXTRA: 'PREVENT_EXTRA'}
+    __slots__ = ('schema', 'required', 'extra', '_compiled', '_compile_cache')
 
     def __init__(self, schema: Schemable, required: bool=False, extra: int=PREVENT_EXTRA) -> None:
         """Create a new Schema.
@@ -130,13 +174,52 @@ class Schema(object):
         self.schema: typing.Any = schema
         self.required = required
         self.extra = int(extra)
+        # Compiled validators keyed by id() of the sub-schema they came from.
+        # Each entry also holds the sub-schema itself so its id can't be
+        # reused by another object while the entry exists.
+        self._compile_cache: typing.Dict[int, typing.Tuple[typing.Any, typing.Callable]] = {}
         self._compiled = self._compile(schema)
 
     def _compile(self, schema):
-        """Compile the schema into a callable validator."""
+        """Compile the schema into a callable validator.
+
+        A sub-schema object shared by several keys or items is only compiled
+        once per Schema.
+        """
+        entry = self._compile_cache.get(id(schema))
+        if entry is not None:
+            return entry[1]
+        compiled = self._compile_uncached(schema)
+        self._compile_cache[id(schema)] = (schema, compiled)
+        return compiled
+
+    def _compile_uncached(self, schema):
         if hasattr(schema, '__voluptuous_compile__'):
             return schema.__voluptuous_compile__(self)
 
+        # Extra accepts any key or item and passes it through unchanged.
+        if schema is Extra:
+            return _pass_through
+
+        # Exact type checks first: plain containers are by far the most
+        # common schemas and don't need an isinstance() MRO walk.
+        schema_type = type(schema)
+        if schema_type is dict:
+            return self._compile_dict(schema)
+
+        if schema_type is list:
+            return self._compile_list(schema)
+
+        if schema_type is tuple:
+            return self._compile_tuple(schema)
+
+        if schema_type is set or schema_type is frozenset:
+            return self._compile_set(schema)
+
+        # Object is a dict subclass, so it has to be matched before dict.
+        if isinstance(schema, Object):
+            return self._compile_object(schema)
+
         if isinstance(schema, dict):
             return self._compile_dict(schema)
 
@@ -146,73 +229,151 @@ class Schema(object):
         if isinstance(schema, tuple):
             return self._compile_tuple(schema)
 
-        if isinstance(schema, set):
+        if isinstance(schema, (set, frozenset)):
             return self._compile_set(schema)
 
-        if isinstance(schema, Object):
-            return self._compile_object(schema)
+        # User classes are compiled per Schema so the process-wide cache
+        # never keeps them alive or needs to hash them.
+        if _is_builtin_scalar(schema):
+            return _compile_scalar_cached(schema)
 
         return _compile_scalar(schema)
 
-    def _compile_dict_with_schema(self, required_keys, value_schema, invalid_msg=None):
-        """Create validator for a dict with a given schema."""
+    def _compile_dict_with_schema(self, required_specs, candidate_pairs, invalid_msg=None, default_specs=(), exclusive_groups=None, inclusive_groups=None):
+        """Create validator for a dict with a given schema.
+
+        ``required_specs`` holds ``(key, compiled_validator, message,
+        default_is_literal, default_value)`` for each required key, with
+        markers already unwrapped to their value. ``candidate_pairs`` is a
+        list of ``(key, compiled_validator)`` pairs covering every key in the
+        schema in matching order. ``default_specs`` holds ``(key,
+        compiled_validator, default_is_literal, default_value)`` for the
+        optional keys that have a default. ``exclusive_groups`` and
+        ``inclusive_groups`` map group labels to their markers, in schema
+        order.
+        """
         if invalid_msg is None:
             invalid_msg = 'dictionary value'
 
+        # Everything that only depends on the schema is resolved here, once,
+        # so validate_dict doesn't re-derive it for every key of every dict.
+        # Literal keys (including markers, by their underlying value) are
+        # matched with a single dict lookup. Type keys and validator keys
+        # (callables and schema objects, which validate the key itself) are
+        # only tried, in schema order, when no literal key matches. Remove
+        # keys are flagged so that their pairs are dropped from the output.
+        literal_map = {}
+        key_patterns = []
+        for skey, compiled in candidate_pairs:
+            key_value = skey.schema if isinstance(skey, Marker) else skey
+            is_remove = isinstance(skey, Remove)
+            if isinstance(key_value, type):
+                key_patterns.append((key_value, None, compiled, is_remove))
+            elif callable(key_value) or hasattr(key_value, '__voluptuous_compile__'):
+                key_patterns.append((None, self._compile(key_value), compiled, is_remove))
+            else:
+                literal_map.setdefault(key_value, (compiled, is_remove))
+        # Required keys are fully handled by the first loop. Flag them in the
+        # literal map so the second loop can skip them with the same lookup
+        # it uses to find validators, instead of tracking a seen-set per call.
+        handled = object()
+        for key, *_ in required_specs:
+            if not isinstance(key, type):
+                literal_map[key] = handled
+        prevent_extra = self.extra == PREVENT_EXTRA
+        allow_extra = self.extra == ALLOW_EXTRA
+        check_groups = _compile_group_check(exclusive_groups or {}, inclusive_groups or {})
+
         def validate_dict(path, data):
             if not isinstance(data, dict):
                 raise er.DictInvalid('expected a dictionary')
 
+            if check_groups is not None:
+                check_groups(path, data)
+
             out = {}
             errors = []
-            seen_keys = set()
 
             # First validate all the required keys
-            for key in required_keys:
-                if key not in data:
-                    errors.append(er.RequiredFieldInvalid(key.msg or 'required key not provided', path + [key]))
-                    continue
+            for key, compiled, required_msg, is_literal, default in required_specs:
+                value = data.get(key, _MISSING)
+                if value is _MISSING:
+                    if default is UNDEFINED:
+                        errors.append(er.RequiredFieldInvalid(required_msg, path + (key,)))
+                        continue
+                    value = default if is_literal else default()
 
                 try:
-                    out[key] = self._compile(value_schema[key])(path + [key], data[key])
+                    result = compiled(path + (key,), value)
                 except er.Invalid as e:
-                    errors.append(e)
-                seen_keys.add(key)
+                    _add_value_errors(errors, e, len(path) + 1, invalid_msg)
+                    continue
+                # Values matched by a Remove marker are left out
+                if result is not Remove:
+                    out[key] = result
 
             # Now validate the rest of the keys
             for key, value in data.items():
-                if key in seen_keys:
-                    continue
-
-                found_valid_key = False
-                found_key_schema = None
-
                 # Try to find a matching key schema
-                for skey, svalue in value_schema.items():
-                    if skey == key:
-                        found_key_schema = svalue
-                        found_valid_key = True
-                        break
-                    if isinstance(skey, type) and isinstance(key, skey):
-                        found_key_schema = svalue
-                        found_valid_key = True
-                        key = skey(key)
+                entry = literal_map.get(key)
+                if entry is handled:
+                    continue
+                key_path = path + (key,)
+                if entry is not None:
+                    compiled, is_remove = entry
+                    try:
+                        result = compiled(key_path, value)
+                    except er.Invalid as e:
+                        # A Remove key whose value doesn't match is treated
+                        # like a key that isn't in the schema.
+                        if not is_remove:
+                            _add_value_errors(errors, e, len(key_path), invalid_msg)
+                            continue
+                    else:
+                        if not is_remove and result is not Remove:
+                            out[key] = result
+                        continue
+
+                for key_type, key_validator, compiled, is_remove in key_patterns:
+                    if key_type is not None:
+                        if not isinstance(key, key_type):
+                            continue
+                        new_key = key_type(key)
+                    else:
+                        try:
+                            new_key = key_validator(key_path, key)
+                        except er.Invalid:
+                            continue
+                    try:
+                        result = compiled(key_path, value)
+                    except er.Invalid as e:
+                        if is_remove:
+                            continue
+                        _add_value_errors(errors, e, len(key_path), invalid_msg)
                         break
-
-                if not found_valid_key:
-                    if self.extra == PREVENT_EXTRA:
-                        errors.append(er.Invalid('extra keys not allowed', path + [key]))
-                    elif self.extra == ALLOW_EXTRA:
+                    if not is_remove and result is not Remove:
+                        out[new_key] = result
+                    break
+                else:
+                    if prevent_extra:
+                        errors.append(er.Invalid('extra keys not allowed', key_path))
+                    elif allow_extra:
                         out[key] = value
-                    continue
 
+            # Fill in defaults for optional keys that weren't provided
+            for key, compiled, is_literal, default in default_specs:
+                if key in data:
+                    continue
                 try:
-                    out[key] = self._compile(found_key_schema)(path + [key], value)
+                    result = compiled(path + (key,), default if is_literal else default())
                 except er.Invalid as e:
-                    errors.append(e)
+                    _add_value_errors(errors, e, len(path) + 1, invalid_msg)
+                    continue
+                if result is not Remove:
+                    out[key] = result
 
             if errors:
-                raise er.MultipleInvalid(errors)
+                raise er.MultipleInvalid(errors, _own=True)
 
             return out
 
@@ -286,13 +447,22 @@ class Schema(object):
         return '<Schema(%s, extra=%s, required=%s) object at 0x%x>' % (self.schema, self._extra_to_name.get(self.extra, '??'), self.required, id(self))
 
     def __call__(self, data):
-        """Validate data against this schema."""
+        """Validate data against this schema.
+
+        Compiled validators are called as ``validator(path, data)``, where
+        ``path`` is a tuple of the keys leading to ``data``. Tuples are cheap
+        to extend and safe to share between sibling values; they are only
+        turned into a list when an ``Invalid`` is created from them.
+        """
+        # Any validator, including a dict validator rejecting a non-dict, may
+        # raise a bare Invalid, so every call needs this wrapper. Entering the
+        # try block costs nothing measurable on the success path.
         try:
-            return self._compiled([], data)
+            return self._compiled((), data)
         except er.MultipleInvalid:
             raise
         except er.Invalid as e:
-            raise er.MultipleInvalid([e])
+            raise er.MultipleInvalid([e], _own=True)
 
     def _compile_mapping(self, schema, invalid_msg=None):
         """Create validator for given mapping."""
@@ -301,24 +471,32 @@ class Schema(object):
 
         # Keys can be markers (Required, Optional, etc.) or values
         # Markers have a schema attached to them
-        key_schema = set()
-        value_schema = {}
+        candidate_pairs = []
         for key, value in _iterate_mapping_candidates(schema):
-            if isinstance(key, Marker):
-                key_schema.add(key)
-                value_schema[key] = value
-            else:
-                value_schema[key] = value
+            # Compile each value schema once, up front, rather than on every
+            # validation.
+            candidate_pairs.append((key, self._compile(value)))
 
         # Keys which aren't marked as Required are Optional by default
-        required_keys = set(key for key in key_schema if isinstance(key, Required))
+        required_specs = tuple(
+            (key.schema, compiled, key.msg or 'required key not provided', key.default_is_literal, key.default_value)
+            for key, compiled in candidate_pairs if isinstance(key, Required)
+        )
+        default_specs = tuple(
+            (key.schema, compiled, key.default_is_literal, key.default_value)
+            for key, compiled in candidate_pairs
+            if isinstance(key, Optional) and key.default_value is not UNDEFINED
+        )
 
-        # Check for duplicate keys
-        key_names = [str(key) for key in key_schema]
-        if len(set(key_names)) != len(key_names):
-            raise er.SchemaError('duplicate keys found: {}'.format(key_names))
+        exclusive_groups: typing.Dict[str, typing.List[Exclusive]] = {}
+        inclusive_groups: typing.Dict[str, typing.List[Inclusive]] = {}
+        for key, _ in candidate_pairs:
+            if isinstance(key, Exclusive):
+                exclusive_groups.setdefault(key.group_of_exclusion, []).append(key)
+            elif isinstance(key, Inclusive):
+                inclusive_groups.setdefault(key.group_of_inclusion, []).append(key)
 
-        return self._compile_dict_with_schema(required_keys, value_schema, invalid_msg)
+        return self._compile_dict_with_schema(required_specs, candidate_pairs, invalid_msg, default_specs, exclusive_groups, inclusive_groups)
 
     def _compile_object(self, schema):
         """Validate an object.
@@ -342,16 +520,44 @@ class Schema(object):
             raise er.SchemaError('expected Object')
 
         compiled_schema = self._compile_mapping(schema, 'object value')
+        cls = schema.cls
+
+        if cls is UNDEFINED:
+            def validate_object(path, data):
+                return compiled_schema(path, _object_to_dict(path, data))
+
+            return validate_object
+
+        # Instances of a slotted class without a __dict__ always expose the
+        # same attribute names, so they're read directly instead of going
+        # through _object_to_dict. Subclasses may declare their own slots
+        # and fall back to the generic iteration.
+        if isinstance(cls, type) and '__slots__' in vars(cls) and cls.__dictoffset__ == 0:
+            slot_names = []
+            for klass in reversed(cls.__mro__):
+                slots = vars(klass).get('__slots__', ())
+                for key in (slots,) if isinstance(slots, str) else slots:
+                    if key not in slot_names and key != '__weakref__':
+                        slot_names.append(key)
+
+            def validate_object(path, data):
+                if not isinstance(data, cls):
+                    raise er.ObjectInvalid('expected instance of {}'.format(cls), path)
+                if type(data) is not cls:
+                    return compiled_schema(path, _object_to_dict(path, data))
+                obj_dict = {}
+                for key in slot_names:
+                    value = getattr(data, key, _MISSING)
+                    if value is not _MISSING:
+                        obj_dict[key] = value
+                return compiled_schema(path, obj_dict)
+
+            return validate_object
 
         def validate_object(path, data):
-            if schema.cls is not UNDEFINED and not isinstance(data, schema.cls):
-                raise er.ObjectInvalid('expected instance of {}'.format(schema.cls))
-            
-            obj_dict = {}
-            for key, value in _iterate_object(data):
-                obj_dict[key] = value
-
-            return compiled_schema(path, obj_dict)
+            if not isinstance(data, cls):
+                raise er.ObjectInvalid('expected instance of {}'.format(cls), path)
+            return compiled_schema(path, _object_to_dict(path, data))
 
         return validate_object
 
@@ -452,27 +658,78 @@ class Schema(object):
         if not isinstance(schema, (list, tuple, set)):
             raise er.SchemaError('expected sequence')
 
+        validators = tuple(self._compile(validator) for validator in schema)
+        type_error = 'expected a {}'.format(seq_type.__name__)
+
+        # A lone Remove marker drops items, which the single-validator fast
+        # paths below don't handle; it goes through the general loop.
+        if len(validators) == 1 and not isinstance(next(iter(schema)), Remove):
+            validator = validators[0]
+
+            # The common ``[int]`` shape: no alternatives to fall back to, so
+            # each item is validated exactly once.
+            def validate_homogeneous_sequence(path, data):
+                if not isinstance(data, seq_type):
+                    raise er.SequenceTypeInvalid(type_error, path)
+
+                result = []
+                errors = []
+                depth = len(path) + 1
+                for i, value in enumerate(data):
+                    try:
+                        result.append(validator(path + (i,), value))
+                    except er.Invalid as e:
+                        if len(e.path) > depth:
+                            raise
+                        errors.append(e)
+                if errors:
+                    raise er.MultipleInvalid(errors, _own=True)
+                return result if seq_type is list else seq_type(result)
+
+            # For a bare type such as ``[int]``, check every item in a single
+            # C-level pass first. Only sequences containing a bad item go
+            # through the per-item validator, which produces the errors.
+            item_schema = next(iter(schema))
+            if isinstance(item_schema, type) and not hasattr(item_schema, '__voluptuous_compile__'):
+                def validate_typed_sequence(path, data):
+                    if isinstance(data, seq_type) and all(map(isinstance, data, itertools.repeat(item_schema))):
+                        return list(data) if seq_type is list else seq_type(data)
+                    return validate_homogeneous_sequence(path, data)
+
+                return validate_typed_sequence
+
+            return validate_homogeneous_sequence
+
         def validate_sequence(path, data):
             if not isinstance(data, seq_type):
-                raise er.SequenceTypeInvalid('expected a {}'.format(seq_type.__name__))
+                raise er.SequenceTypeInvalid(type_error, path)
 
             # Empty sequence
-            if not schema and data:
+            if not validators and data:
                 raise er.Invalid('not a valid value')
 
             result = []
+            errors = []
             for i, value in enumerate(data):
-                valid = False
-                for validator in schema:
+                index_path = path + (i,)
+                invalid = None
+                for validator in validators:
                     try:
-                        result.append(self._compile(validator)([i] + path, value))
-                        valid = True
-                        break
-                    except er.Invalid:
-                        pass
-                if not valid:
-                    raise er.Invalid('not a valid value for sequence item')
-            return seq_type(result)
+                        cval = validator(index_path, value)
+                    except er.Invalid as e:
+                        if len(e.path) > len(index_path):
+                            raise
+                        invalid = e
+                        continue
+                    # Items matched by a Remove marker are left out
+                    if cval is not Remove:
+                        result.append(cval)
+                    break
+                else:
+                    errors.append(invalid)
+            if errors:
+                raise er.MultipleInvalid(errors, _own=True)
+            return result if seq_type is list else seq_type(result)
 
         return validate_sequence
 
@@ -519,9 +776,34 @@ class Schema(object):
         >>> with raises(er.MultipleInvalid, 'invalid value in set'):
         ...   validator(set(['a']))
         """
-        return self._compile_sequence(schema, set)
+        set_type = type(schema)
+        type_error = 'expected a {}'.format(set_type.__name__)
+        invalid_msg = 'invalid value in {}'.format(set_type.__name__)
+        validators = tuple(self._compile(validator) for validator in schema)
 
-    def extend(self, schema: Schemable, required: typing.Optional[bool]=None, extra: typing.Optional[int]=None) -> Schema:
+        def validate_set(path, data):
+            if not isinstance(data, set_type):
+                raise er.Invalid(type_error, path)
+
+            # Set items have no position, so a bad item is reported at the
+            # path of the set itself.
+            errors = []
+            for value in data:
+                for validator in validators:
+                    try:
+                        validator(path, value)
+                    except er.Invalid:
+                        continue
+                    break
+                else:
+                    errors.append(er.Invalid(invalid_msg, path))
+            if errors:
+                raise er.MultipleInvalid(errors, _own=True)
+            return data
+
+        return validate_set
+
+    def extend(self, schema: Schemable, required: bool | None=None, extra: int | None=None) -> Schema:
         """Create a new `Schema` by merging this and the provided `schema`.
 
         Neither this `Schema` nor the provided `schema` are modified. The
@@ -560,82 +842,237 @@ class Schema(object):
 
 def _path_string(path):
     """Convert a list path to a string path."""
-    if not path:
-        return ''
-    return ' @ data[%s]' % ']['.join(repr(p) for p in path)
+    return er._format_path(path)
 
 def _compile_scalar(schema):
     """A scalar value.
 
     The schema can either be a value or a type.
 
-    >>> _compile_scalar(int)([], 1)
+    >>> _compile_scalar(int)((), 1)
     1
     >>> with raises(er.Invalid, 'expected float'):
-    ...   _compile_scalar(float)([], '1')
+    ...   _compile_scalar(float)((), '1')
 
     Callables have
-    >>> _compile_scalar(lambda v: float(v))([], '1')
+    >>> _compile_scalar(lambda v: float(v))((), '1')
     1.0
 
     As a convenience, ValueError's are trapped:
 
     >>> with raises(er.Invalid, 'not a valid value'):
-    ...   _compile_scalar(lambda v: float(v))([], 'a')
+    ...   _compile_scalar(lambda v: float(v))((), 'a')
     """
-    if isinstance(schema, type):
+    # Bare classes are the common case; their type is exactly ``type``, which
+    # is cheaper to check than an isinstance() that also covers metaclasses.
+    if type(schema) is type or isinstance(schema, type):
+        msg = 'expected %s' % schema.__name__
+
         def validate_instance(path, data):
             if isinstance(data, schema):
                 return data
-            else:
-                msg = 'expected {} for {}'.format(schema.__name__, _path_string(path))
-                raise er.TypeInvalid(msg)
+            raise er.TypeInvalid(msg, path)
         return validate_instance
 
     if callable(schema):
+        # Callables that declare ``_voluptuous_pure = True`` promise never to
+        # raise ValueError or Invalid, so they're called without a try block.
+        if getattr(schema, '_voluptuous_pure', False):
+            def validate_pure_callable(path, data):
+                return schema(data)
+            return validate_pure_callable
+
         def validate_callable(path, data):
             try:
                 return schema(data)
-            except ValueError as e:
-                raise er.Invalid('not a valid value')
+            except ValueError:
+                raise er.ValueInvalid('not a valid value', path)
             except er.Invalid as e:
-                e.path = path + e.path
+                e.path = [*path, *e.path]
                 raise
         return validate_callable
 
     def validate_value(path, data):
         if data != schema:
-            raise er.ScalarInvalid('not a valid value')
+            raise er.ScalarInvalid('not a valid value', path)
         return data
 
     return validate_value
 
-def _compile_itemsort():
-    """return sort function of mappings"""
-    def sort_item(item):
-        key, _ = item
-        if isinstance(key, Marker):
-            return 0 if isinstance(key, Required) else 1, str(key)
-        return 2, str(key)
-    return sort_item
-_sort_item = _compile_itemsort()
+def _is_builtin_scalar(schema):
+    """Whether ``schema`` is None, a primitive value or a builtin type.
+
+    Only these schemas are shared through the process-wide caches: they're
+    always hashable and outlive any Schema anyway, so caching them never
+    keeps user classes or functions alive.
+    """
+    schema_type = type(schema)
+    return schema is None or schema_type in primitive_types or (schema_type is type and schema.__module__ == 'builtins')
+
+@lru_cache(maxsize=1024, typed=True)
+def _cached_schema(schema):
+    """Shared Schema instances for builtin scalar schemas.
+
+    Decorators and markers wrap the same small schemas (``int``, ``'key'``)
+    over and over; those are compiled once and reused. The cache is bounded,
+    so memory stays flat however many distinct schemas pass through it.
+    """
+    return Schema(schema)
+
+def _schema_for(schema):
+    """Return a Schema for ``schema``, shared when it is a builtin scalar.
+
+    Schema instances are used as they are, rather than being wrapped in a
+    second Schema that would call them as an opaque callable.
+    """
+    if isinstance(schema, Schema):
+        return schema
+    if _is_builtin_scalar(schema):
+        return _cached_schema(schema)
+    return Schema(schema)
+
+def _argument_validator(schema):
+    """Return a ``validator(path, data)`` for a validate() argument schema.
+
+    A plain Schema hands out its compiled validator. Subclasses may override
+    __call__, so they are called instead, with their errors moved under the
+    argument's path.
+    """
+    schema = _schema_for(schema)
+    if type(schema) is Schema:
+        return schema._compiled
+
+    def validate_argument(path, data):
+        try:
+            return schema(data)
+        except er.MultipleInvalid as e:
+            for error in e.errors:
+                error.path = [*path, *error.path]
+            raise
+        except er.Invalid as e:
+            e.path = [*path, *e.path]
+            raise
+
+    return validate_argument
+
+def _compile_group_check(exclusive_groups, inclusive_groups):
+    """Build a checker for Exclusive and Inclusive key groups.
+
+    Each group is reduced to a frozenset of its keys, so checking a dict
+    takes one set intersection per group. Returns None when the schema has
+    no groups, letting the dict validator skip the check entirely.
+    """
+    if not exclusive_groups and not inclusive_groups:
+        return None
+
+    exclusive_specs = []
+    for label, group in exclusive_groups.items():
+        keys = tuple(marker.schema for marker in group)
+        msgs = tuple(marker.msg or "two or more values in the same group of exclusion '%s'" % label for marker in group)
+        exclusive_specs.append((keys, frozenset(keys), msgs, VirtualPathComponent(label)))
+
+    inclusive_specs = []
+    for label, group in inclusive_groups.items():
+        msg = next((marker.msg for marker in group if marker.msg), None)
+        if msg is None:
+            msg = "some but not all values in the same group of inclusion '%s'" % label
+        inclusive_specs.append((frozenset(marker.schema for marker in group), msg, VirtualPathComponent(label)))
+
+    def check_groups(path, data):
+        errors = []
+        for keys, key_set, msgs, component in exclusive_specs:
+            if len(data.keys() & key_set) > 1:
+                # Report with the message of the second key found, in
+                # schema order.
+                second = [i for i, key in enumerate(keys) if key in data][1]
+                errors.append(er.ExclusiveInvalid(msgs[second], path + (component,)))
+        if errors:
+            raise er.MultipleInvalid(errors, _own=True)
+
+        for key_set, msg, component in inclusive_specs:
+            present = data.keys() & key_set
+            if present and len(present) != len(key_set):
+                raise er.MultipleInvalid([er.InclusiveInvalid(msg, path + (component,))], _own=True)
+
+    return check_groups
+
+def _pass_through(path, data):
+    return data
+
+def _add_value_errors(errors, error, depth, invalid_msg):
+    """Collect the errors raised by a mapping value's validator.
+
+    A MultipleInvalid is flattened into its sub-errors. Errors about the
+    value itself, rather than something nested inside it, are tagged with
+    ``invalid_msg`` (e.g. ``'dictionary value'``) as their error type.
+    """
+    for err in error.errors if isinstance(error, er.MultipleInvalid) else (error,):
+        if len(err.path) <= depth:
+            err.error_type = invalid_msg
+        errors.append(err)
+
+@lru_cache(maxsize=4096, typed=True)
+def _compile_scalar_cached(schema):
+    """Shared validators for builtin types and primitive values.
+
+    Validators for these schemas only close over the schema itself, so
+    equal schemas (e.g. every ``int`` in ``{'a': int, 'b': int}``) can reuse
+    one function. ``typed=True`` keeps ``1``, ``1.0`` and ``True`` apart.
+    """
+    return _compile_scalar(schema)
 
 def _iterate_mapping_candidates(schema):
-    """Iterate over schema in a meaningful order."""
-    return sorted(schema.items(), key=_sort_item)
+    """Iterate over schema in a meaningful order.
 
-def _iterate_object(obj):
-    """Return iterator over object attributes. Respect objects with
-    defined __slots__.
+    Required keys come first, then other markers, then everything else; each
+    group keeps the schema's own (insertion) order.
 
+    Raises :class:`SchemaError` if two markers share the same name.
     """
-    if hasattr(obj, '__slots__'):
-        for key in obj.__slots__:
-            if hasattr(obj, key):
-                yield key, getattr(obj, key)
-    else:
-        for key, value in obj.__dict__.items():
-            yield key, value
+    required, markers, rest = [], [], []
+    marker_names = set()
+    duplicates = []
+    for item in schema.items():
+        key = item[0]
+        if isinstance(key, Marker):
+            name = str(key)
+            if name in marker_names:
+                duplicates.append(name)
+            else:
+                marker_names.add(name)
+            if isinstance(key, Required):
+                required.append(item)
+            else:
+                markers.append(item)
+        else:
+            rest.append(item)
+    if duplicates:
+        raise er.SchemaError('duplicate keys found: {}'.format(duplicates))
+    return required + markers + rest
+
+def _object_to_dict(path, obj):
+    """Return object attributes as a dict. Respect objects with
+    defined __slots__, and named tuples.
+
+    Values without attributes at all (ints, strings, None...) are
+    rejected with ObjectInvalid.
+    """
+    try:
+        attributes = dict(vars(obj))
+    except TypeError:
+        if hasattr(obj, '_asdict'):
+            attributes = dict(obj._asdict())
+        elif hasattr(obj, '__slots__'):
+            attributes = {}
+        else:
+            raise er.ObjectInvalid('expected an object', path)
+    slots = getattr(obj, '__slots__', ())
+    for key in (slots,) if isinstance(slots, str) else slots:
+        if key != '__dict__':
+            value = getattr(obj, key, _MISSING)
+            if value is not _MISSING:
+                attributes[key] = value
+    return attributes
 
 class Msg(object):
     """Report a user-friendly message if a schema fails to validate.
@@ -665,8 +1102,9 @@ class Msg(object):
     ... except er.MultipleInvalid as e:
     ...   assert isinstance(e.errors[0], er.RangeInvalid)
     """
+    __slots__ = ('_schema', 'schema', 'msg', 'cls')
 
-    def __init__(self, schema: Schemable, msg: str, cls: typing.Optional[typing.Type[Error]]=None) -> None:
+    def __init__(self, schema: Schemable, msg: str, cls: typing.Type[Error] | None=None) -> None:
         if cls and (not issubclass(cls, er.Invalid)):
             raise er.SchemaError('Msg can only use subclases of Invalid as custom class')
         self._schema = schema
@@ -688,6 +1126,7 @@ class Msg(object):
 
 class Object(dict):
     """Indicate that we should work with attributes, not keys."""
+    __slots__ = ('cls',)
 
     def __init__(self, schema: typing.Any, cls: object=UNDEFINED) -> None:
         self.cls = cls
@@ -710,6 +1149,7 @@ class Self(object):
     >>> s('hi')
     'hi'
     """
+    __slots__ = ()
 
     def __call__(self, v):
         return v
@@ -723,14 +1163,22 @@ class Marker(object):
     `description` is an optional field, unused by Voluptuous itself, but can be
     introspected by any external tool, for example to generate schema documentation.
     """
-    __slots__ = ('schema', '_schema', 'msg', 'description', '__hash__')
+    __slots__ = ('schema', '_schema', 'msg', 'description', '_hash')
 
-    def __init__(self, schema_: Schemable, msg: typing.Optional[str]=None, description: typing.Any | None=None) -> None:
+    def __init__(self, schema_: Schemable, msg: str | None=None, description: typing.Any | None=None) -> None:
         self.schema: typing.Any = schema_
-        self._schema = Schema(schema_)
+        self._schema = _schema_for(schema_)
         self.msg = msg
         self.description = description
-        self.__hash__ = cache(lambda: hash(schema_))
+        # Markers are used as dict keys and hashed a lot while compiling
+        # schemas, so compute the hash of the wrapped schema once.
+        try:
+            self._hash = hash(schema_)
+        except TypeError:
+            self._hash = id(schema_)
+
+    def __hash__(self):
+        return self._hash
 
     def __call__(self, v):
         try:
@@ -779,10 +1227,13 @@ class Optional(Marker):
     >>> schema({'key2':'value'})
     {'key2': 'value'}
     """
+    __slots__ = ('default_is_literal', 'default_value')
 
-    def __init__(self, schema: Schemable, msg: typing.Optional[str]=None, default: typing.Any=UNDEFINED, description: typing.Any | None=None) -> None:
+    def __init__(self, schema: Schemable, msg: str | None=None, default: typing.Any=UNDEFINED, description: typing.Any | None=None) -> None:
         super(Optional, self).__init__(schema, msg=msg, description=description)
-        self.default = default_factory(default)
+        self.default_is_literal, self.default_value = _default_spec(default)
+
+    default = property(_marker_default)
 
 class Exclusive(Optional):
     """Mark a node in the schema as exclusive.
@@ -819,8 +1270,9 @@ class Exclusive(Optional):
     ...     schema({'classic': {'email': 'foo@example.com', 'password': 'bar'},
     ...             'social': {'social_network': 'barfoo', 'token': 'tEMp'}})
     """
+    __slots__ = ('group_of_exclusion',)
 
-    def __init__(self, schema: Schemable, group_of_exclusion: str, msg: typing.Optional[str]=None, description: typing.Any | None=None) -> None:
+    def __init__(self, schema: Schemable, group_of_exclusion: str, msg: str | None=None, description: typing.Any | None=None) -> None:
         super(Exclusive, self).__init__(schema, msg=msg, description=description)
         self.group_of_exclusion = group_of_exclusion
 
@@ -865,8 +1317,9 @@ class Inclusive(Optional):
     >>> data == schema(data)
     True
     """
+    __slots__ = ('group_of_inclusion',)
 
-    def __init__(self, schema: Schemable, group_of_inclusion: str, msg: typing.Optional[str]=None, description: typing.Any | None=None, default: typing.Any=UNDEFINED) -> None:
+    def __init__(self, schema: Schemable, group_of_inclusion: str, msg: str | None=None, description: typing.Any | None=None, default: typing.Any=UNDEFINED) -> None:
         super(Inclusive, self).__init__(schema, msg=msg, default=default, description=description)
         self.group_of_inclusion = group_of_inclusion
 
@@ -884,10 +1337,13 @@ class Required(Marker):
     >>> schema({})
     {'key': []}
     """
+    __slots__ = ('default_is_literal', 'default_value')
 
-    def __init__(self, schema: Schemable, msg: typing.Optional[str]=None, default: typing.Any=UNDEFINED, description: typing.Any | None=None) -> None:
+    def __init__(self, schema: Schemable, msg: str | None=None, default: typing.Any=UNDEFINED, description: typing.Any | None=None) -> None:
         super(Required, self).__init__(schema, msg=msg, description=description)
-        self.default = default_factory(default)
+        self.default_is_literal, self.default_value = _default_spec(default)
+
+    default = property(_marker_default)
 
 class Remove(Marker):
     """Mark a node in the schema to be removed and excluded from the validated
@@ -903,19 +1359,25 @@ class Remove(Marker):
     >>> schema([1, 2, 3, 4.0, 5, 6.0, '7'])
     [1, 2, 3, 5, '7']
     """
+    __slots__ = ()
 
-    def __init__(self, schema_: Schemable, msg: typing.Optional[str]=None, description: typing.Any | None=None) -> None:
-        super().__init__(schema_, msg, description)
-        self.__hash__ = cache(lambda: object.__hash__(self))
+    # Every Remove is a distinct key, even when two wrap the same schema.
+    __hash__ = object.__hash__
 
     def __call__(self, schema: Schemable):
-        super(Remove, self).__call__(schema)
-        return self.__class__
+        # Only whether the value matches matters, the validated value is
+        # dropped. Without a custom message there's nothing for
+        # Marker.__call__ to rewrite, so the Schema is called directly.
+        if self.msg:
+            super(Remove, self).__call__(schema)
+        else:
+            self._schema(schema)
+        return Remove
 
     def __repr__(self):
-        return 'Remove(%r)' % (self.schema,)
+        return f'Remove({self.schema!r})'
 
-def message(default: typing.Optional[str]=None, cls: typing.Optional[typing.Type[Error]]=None) -> typing.Callable:
+def message(default: str | None=None, cls: typing.Type[Error] | None=None) -> typing.Callable:
     """Convenience decorator to allow functions to provide a message.
 
     Set a default message:
@@ -943,15 +1405,43 @@ def message(default: typing.Optional[str]=None, cls: typing.Optional[typing.Type
         ... except er.MultipleInvalid as e:
         ...   assert isinstance(e.errors[0], IntegerInvalid)
     """
-    pass
+    if cls and not issubclass(cls, er.Invalid):
+        raise er.SchemaError('message can only use subclases of Invalid as custom class')
 
-def _args_to_dict(func, args):
-    """Returns argument names as values as key-value pairs."""
-    pass
+    def decorator(f):
+        @wraps(f)
+        def check(msg=None, clsoverride=None):
+            # Message and error class are resolved once per validator, so a
+            # failing call only has to raise them.
+            error_msg = msg or default or 'invalid value'
+            error_cls = clsoverride or cls or er.ValueInvalid
+
+            @wraps(f)
+            def wrapper(*args, **kwargs):
+                try:
+                    return f(*args, **kwargs)
+                except ValueError:
+                    raise error_cls(error_msg)
+
+            return wrapper
+
+        return check
+
+    return decorator
+
+def _positional_names(func):
+    """Return the names of the parameters of ``func`` that can be passed by position.
+
+    ``inspect.signature`` follows ``__wrapped__``, so functions that are
+    already wrapped by another decorator report their real parameters.
+    """
+    import inspect
+    kinds = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    return tuple(name for name, param in inspect.signature(func).parameters.items() if param.kind in kinds)
 
-def _merge_args_with_kwargs(args_dict, kwargs_dict):
-    """Merge args with kwargs."""
-    pass
+def _args_to_dict(param_names, args):
+    """Returns argument names as values as key-value pairs."""
+    return dict(zip(param_names, args))
 
 def validate(*a, **kw) -> typing.Callable:
     """Decorator for validating arguments of a function against a given schema.
@@ -969,4 +1459,62 @@ def validate(*a, **kw) -> typing.Callable:
         ...   return arg1 * 2
 
     """
-    pass
\ No newline at end of file
+    RETURNS_KEY = '__return__'
+
+    # Nothing to check: hand the function back instead of wrapping it.
+    if not a and not kw:
+        return lambda func: func
+
+    def validate_schema_decorator(func):
+        # The signature is only inspected here, once per decorated function.
+        param_names = _positional_names(func)
+        schema_arguments = _args_to_dict(param_names, a)
+        schema_arguments.update(kw)
+        output_schema = _schema_for(schema_arguments.pop(RETURNS_KEY)) if RETURNS_KEY in schema_arguments else None
+
+        # The call layout is resolved once, here: only positions that have
+        # a schema are listed, and keyword arguments are looked up by name.
+        # Calls then validate those arguments in place and pass everything
+        # else through untouched, without building an argument dict.
+        validators = {name: _argument_validator(schema) for name, schema in schema_arguments.items()}
+        positional_checks = tuple((i, name, validators[name]) for i, name in enumerate(param_names) if name in validators)
+        # Only the bound lookup is captured, so the table can't be changed
+        # once the function is decorated.
+        get_validator = validators.get
+
+        @wraps(func)
+        def func_wrapper(*args, **kwargs):
+            errors = []
+            if positional_checks and args:
+                nargs = len(args)
+                args = list(args)
+                for i, name, validator in positional_checks:
+                    if i >= nargs:
+                        break
+                    try:
+                        args[i] = validator((name,), args[i])
+                    except er.MultipleInvalid as e:
+                        errors.extend(e.errors)
+                    except er.Invalid as e:
+                        errors.append(e)
+            for name, value in kwargs.items():
+                validator = get_validator(name)
+                if validator is None:
+                    continue
+                try:
+                    kwargs[name] = validator((name,), value)
+                except er.MultipleInvalid as e:
+                    errors.extend(e.errors)
+                except er.Invalid as e:
+                    errors.append(e)
+            if errors:
+                raise er.MultipleInvalid(errors, _own=True)
+
+            output = func(*args, **kwargs)
+            if output_schema is not None:
+                return output_schema(output)
+            return output
+
+        return func_wrapper
+
+    return validate_schema_decorator
@@ -1,9 +1,13 @@
 # fmt: off
 import collections
 import copy
+import gc
 import os
+import pickle
 import sys
+import weakref
 from enum import Enum
+from functools import wraps
 
 import pytest
 
@@ -12,11 +16,11 @@ from voluptuous import (
     ContainsInvalid, Date, Datetime, Email, EmailInvalid, Equal, ExactSequence,
     Exclusive, Extra, FqdnUrl, In, Inclusive, InInvalid, Invalid, IsDir, IsFile, Length,
     Literal, LiteralInvalid, Marker, Match, MatchInvalid, Maybe, MultipleInvalid, NotIn,
-    NotInInvalid, Number, Object, Optional, PathExists, Range, Remove, Replace,
+    NotInInvalid, Number, Object, ObjectInvalid, Optional, PathExists, Range, Remove, Replace,
     Required, Schema, Self, SomeOf, TooManyValid, TypeInvalid, Union, Unordered, Url,
     UrlInvalid, raises, validate,
 )
-from voluptuous.humanize import humanize_error
+from voluptuous.humanize import humanize_error, humanize_error_iter
 from voluptuous.util import Capitalize, Lower, Strip, Title, Upper
 
 # fmt: on
@@ -368,6 +372,9 @@ def test_copy_dict_undefined():
     except Exception as e:
         assert isinstance(e, MultipleInvalid)
 
+    with raises(MultipleInvalid, "required key not provided @ data['foo']"):
+        schema({})
+
 
 def test_sorting():
     """Expect alphabetic sorting"""
@@ -577,6 +584,42 @@ def test_humanize_error():
     )
 
 
+def test_humanize_error_max_errors():
+    data = {'a': 1, 'b': 2, 'c': 3}
+    error = MultipleInvalid(
+        [Invalid('bad a', ['a']), Invalid('bad b', ['b']), Invalid('bad c', ['c'])]
+    )
+    assert humanize_error(data, error, max_errors=2) == (
+        "bad a @ data['a']. Got 1\nbad b @ data['b']. Got 2\n... and 1 more errors"
+    )
+    assert humanize_error(data, error, max_errors=3).count('\n') == 2
+
+
+def test_humanize_error_iter():
+    data = {'a': 1, 'b': 2}
+    error = MultipleInvalid([Invalid('bad b', ['b']), Invalid('bad a', ['a'])])
+    lines = humanize_error_iter(data, error)
+    assert next(lines) == "bad a @ data['a']. Got 1"
+    assert list(lines) == ["bad b @ data['b']. Got 2"]
+    assert '\n'.join(humanize_error_iter(data, error)) == humanize_error(data, error)
+
+
+def test_humanize_error_missing_prefix():
+    error = MultipleInvalid([Invalid('bad x', ['x']), Invalid('bad x1', ['x', 1])])
+    assert humanize_error({}, error) == (
+        "bad x @ data['x']. Got 'N/A'\n"
+        "bad x1 @ data['x'][1]. Got 'N/A'"
+    )
+
+
+def test_humanize_error_control_characters():
+    class Noisy(object):
+        def __repr__(self):
+            return 'line1\nline2\x00'
+
+    assert humanize_error({'a': Noisy()}, Invalid('bad', ['a'])) == "bad @ data['a']. Got line1.line2."
+
+
 def test_fix_157():
     s = Schema(All([Any('one', 'two', 'three')]), Length(min=1))
     assert ['one'] == s(['one'])
@@ -935,6 +978,79 @@ def test_schema_decorator_partial_unmatch_called_with_kwargs():
     pytest.raises(Invalid, fn, arg1=1, arg2="foo")
 
 
+def test_schema_decorator_collects_argument_errors():
+    @validate(int, arg2=str)
+    def fn(arg1, arg2, *rest):
+        return arg1, arg2, rest
+
+    assert fn(1, 'a', 'extra') == (1, 'a', ('extra',))
+    with pytest.raises(MultipleInvalid) as ctx:
+        fn('x', arg2=2)
+    assert sorted(e.path for e in ctx.value.errors) == [['arg1'], ['arg2']]
+
+
+def test_schema_decorator_uses_schema_subclass_call():
+    class Stripped(Schema):
+        def __call__(self, data):
+            return super().__call__(data.strip())
+
+    @validate(arg=Stripped(str))
+    def fn(arg):
+        return arg
+
+    assert fn(' a ') == 'a'
+    assert fn(arg=' a ') == 'a'
+
+    @validate(arg=Stripped(int))
+    def number(arg):
+        return arg
+
+    with pytest.raises(MultipleInvalid) as ctx:
+        number(' a ')
+    assert ctx.value.errors[0].path == ['arg']
+
+
+def test_schema_decorator_with_schema_instance():
+    @validate(Schema({'a': int}))
+    def fn(arg):
+        return arg
+
+    assert fn({'a': 1}) == {'a': 1}
+    with pytest.raises(MultipleInvalid) as ctx:
+        fn({'a': 'x'})
+    assert ctx.value.errors[0].path == ['arg', 'a']
+
+
+def test_schema_decorator_without_schemas():
+    def fn(arg):
+        return arg
+
+    assert validate()(fn) is fn
+
+
+def test_schema_decorator_wrapped_function():
+    def passthrough(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    @validate(int, arg2=str)
+    @passthrough
+    def fn(arg1, arg2):
+        return arg1, arg2
+
+    assert fn(1, 'a') == (1, 'a')
+    pytest.raises(Invalid, fn, 'x', 'a')
+
+
+def test_remove_in_sequence():
+    assert Schema([int, Remove(float)])([1, 2.0, 3]) == [1, 3]
+    assert Schema([Remove(str)])(['a', 'b']) == []
+    pytest.raises(MultipleInvalid, Schema([Remove(str)]), [1])
+
+
 def test_number_validation_with_string():
     """Test with Number with string"""
     schema = Schema({"number": Number(precision=6, scale=2)})
@@ -1352,6 +1468,39 @@ def test_path_with_list_index():
     assert ctx.value.errors[0].path == ['string_key', 1]
 
 
+def test_homogeneous_list_reports_item_path():
+    schema = Schema([int])
+    data = [1, 2, 3]
+    result = schema(data)
+    assert result == data and result is not data
+
+    with pytest.raises(MultipleInvalid) as ctx:
+        schema([1, 2, 'x', 4, 'y'])
+    assert [e.path for e in ctx.value.errors] == [[2], [4]]
+    assert str(ctx.value) == 'expected int @ data[2]'
+
+
+def test_homogeneous_list_validates_each_item_once():
+    calls = []
+
+    def check(v):
+        calls.append(v)
+        if not isinstance(v, int):
+            raise ValueError
+        return v
+
+    with pytest.raises(MultipleInvalid):
+        Schema([check])([1, 'x', 3])
+    assert calls == [1, 'x', 3]
+
+
+def test_set_item_errors_have_no_index():
+    with pytest.raises(MultipleInvalid) as ctx:
+        Schema({'a': {int}})({'a': {'x', 'y'}})
+    assert [e.path for e in ctx.value.errors] == [['a'], ['a']]
+    assert str(ctx.value.errors[0]) == "invalid value in set for dictionary value @ data['a']"
+
+
 def test_path_with_tuple_index():
     """Position of the offending tuple index included in path as int"""
     s = Schema({'string_key': (int,)})
@@ -1527,6 +1676,24 @@ def test_lower_util_handles_various_inputs():
     assert Lower(u"A") == u"a"
 
 
+def test_pure_callables_skip_error_conversion():
+    schema = Schema({'name': Lower, 'title': Title})
+    assert schema({'name': 'AbC', 'title': 'hello world'}) == {'name': 'abc', 'title': 'Hello World'}
+
+    def pure(v):
+        raise ValueError('boom')
+
+    pure._voluptuous_pure = True
+
+    def impure(v):
+        raise ValueError('boom')
+
+    pytest.raises(ValueError, Schema(pure), 1)
+    with pytest.raises(MultipleInvalid) as ctx:
+        Schema({'a': impure})({'a': 1})
+    assert str(ctx.value) == "not a valid value for dictionary value @ data['a']"
+
+
 def test_upper_util_handles_various_inputs():
     assert Upper(3) == "3"
     assert Upper(u"3") == u"3"
@@ -1594,6 +1761,122 @@ def test_inclusive():
         schema({'x': 1})
 
 
+def test_literal_key_takes_precedence_over_type_key():
+    schema = Schema({'a': int, str: str})
+    assert schema({'a': 1, 'b': 'x'}) == {'a': 1, 'b': 'x'}
+    with pytest.raises(MultipleInvalid) as ctx:
+        schema({'a': 'x'})
+    assert ctx.value.errors[0].path == ['a']
+    assert isinstance(ctx.value.errors[0], TypeInvalid)
+
+
+def test_optional_type_key():
+    schema = Schema({Optional(str): int})
+    assert schema({}) == {}
+    assert schema({'x': 1, 'y': 2}) == {'x': 1, 'y': 2}
+    with raises(MultipleInvalid, "expected int for dictionary value @ data['x']"):
+        schema({'x': 'y'})
+    with raises(MultipleInvalid, "extra keys not allowed @ data[1]"):
+        schema({1: 1})
+
+
+def test_user_class_schema_is_not_kept_alive():
+    class Local(object):
+        pass
+
+    ref = weakref.ref(Local)
+    schema = Schema({'a': Local})
+    assert schema({'a': Local()})
+    del schema, Local
+    gc.collect()
+    assert ref() is None
+
+
+def test_marker_and_validate_schemas_are_not_kept_alive():
+    class Key(str):
+        pass
+
+    class Local(object):
+        pass
+
+    refs = [weakref.ref(Key), weakref.ref(Local)]
+    schema = Schema({Required(Key): int})
+
+    @validate(x=Local)
+    def fn(x):
+        return x
+
+    assert isinstance(fn(Local()), Local)
+    del schema, fn, Key, Local
+    gc.collect()
+    assert [ref() for ref in refs] == [None, None]
+
+
+def test_class_with_unhashable_metaclass():
+    class Meta(type):
+        def __eq__(cls, other):
+            return cls is other
+
+    class Unhashable(metaclass=Meta):
+        pass
+
+    schema = Schema(Unhashable)
+    value = Unhashable()
+    assert schema(value) is value
+    pytest.raises(MultipleInvalid, schema, 1)
+
+
+def test_marker_schema_type_error_not_swallowed():
+    calls = []
+
+    class Broken(object):
+        def __voluptuous_compile__(self, schema):
+            calls.append(schema)
+            raise TypeError('broken schema')
+
+    pytest.raises(TypeError, Required, Broken())
+    assert len(calls) == 1
+
+
+def test_remove_as_dict_value():
+    schema = Schema({'a': Remove(int), 'b': int, str: Remove(str)})
+    assert schema({'a': 1, 'b': 2, 'c': 'x'}) == {'b': 2}
+    pytest.raises(MultipleInvalid, schema, {'a': 'one', 'b': 2})
+
+
+def test_remove_key_drops_matching_pairs():
+    schema = Schema({'weight': int, Remove('color'): str, Remove(int): str})
+    assert schema({'weight': 10, 'color': 'red', 1: 'one'}) == {'weight': 10}
+    # A Remove key whose value doesn't match is an extra key, not an error
+    # for the Remove value schema.
+    with raises(MultipleInvalid, "extra keys not allowed @ data['color']"):
+        schema({'weight': 10, 'color': 1})
+    with raises(MultipleInvalid, "extra keys not allowed @ data[1]"):
+        schema({'weight': 10, 1: 1.0})
+
+
+def test_shared_subschema_compiled_once():
+    calls = []
+
+    class Point(object):
+        def __voluptuous_compile__(self, schema):
+            calls.append(schema)
+            return schema._compile({'x': int, 'y': int})
+
+    point = Point()
+    schema = Schema({'start': point, 'end': point})
+    assert len(calls) == 1
+    assert schema({'start': {'x': 1, 'y': 2}, 'end': {'x': 3, 'y': 4}})['end'] == {'x': 3, 'y': 4}
+
+
+def test_literal_and_callable_defaults():
+    schema = Schema({Optional('tags', default=list): list, Required('n', default=1): int})
+    assert schema({}) == {'n': 1, 'tags': []}
+    assert schema({})['tags'] is not schema({})['tags']
+    assert Optional('n', default=1).default() == 1
+    assert Optional('n').default() is None
+
+
 def test_inclusive_defaults():
     schema = Schema(
         {
@@ -1761,6 +2044,51 @@ def test_object():
     pytest.raises(MultipleInvalid, s, 345)
 
 
+def test_invalid_pickle_and_copy_keep_details():
+    error = Invalid('bad', ['a', 1], error_message='really bad', error_type='x')
+    multiple = MultipleInvalid([error, Invalid('worse', ['b'])])
+    for copied in (pickle.loads(pickle.dumps(error)), copy.copy(error), copy.deepcopy(error)):
+        assert copied.path == ['a', 1]
+        assert copied.error_message == 'really bad'
+        assert copied.error_type == 'x'
+        assert str(copied) == str(error)
+    for copied in (pickle.loads(pickle.dumps(multiple)), copy.deepcopy(multiple)):
+        assert [e.path for e in copied.errors] == [['a', 1], ['b']]
+        assert str(copied) == str(multiple)
+
+
+def test_object_rejects_non_objects():
+    schema = Schema(Object({'value': int}))
+    for value in (345, None, 'abc'):
+        with pytest.raises(MultipleInvalid) as ctx:
+            schema(value)
+        assert isinstance(ctx.value.errors[0], ObjectInvalid)
+
+
+def test_object_with_slots():
+    class Base(object):
+        __slots__ = ('x',)
+
+    class Point(Base):
+        __slots__ = ('y',)
+
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    schema = Schema(Object({'x': int, 'y': int}, cls=Point))
+    assert schema(Point(1, 2)) == {'x': 1, 'y': 2}
+
+    with pytest.raises(MultipleInvalid) as ctx:
+        schema(Point(1, 'two'))
+    assert ctx.value.path == ['y']
+
+    for value in (345, None, 'abc'):
+        with pytest.raises(MultipleInvalid) as ctx:
+            schema(value)
+        assert isinstance(ctx.value.errors[0], ObjectInvalid)
+
+
 def test_exception():
     s = Schema(None)
     with pytest.raises(MultipleInvalid) as ctx:
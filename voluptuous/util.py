@@ -13,6 +13,7 @@ def Lower(v: str) -> str:
     'hi'
     """
     return str(v).lower()
+Lower._voluptuous_pure = True  # type: ignore[attr-defined]
 
 def Upper(v: str) -> str:
     """Transform a string to upper case.
@@ -22,6 +23,7 @@ def Upper(v: str) -> str:
     'HI'
     """
     return str(v).upper()
+Upper._voluptuous_pure = True  # type: ignore[attr-defined]
 
 def Capitalize(v: str) -> str:
     """Capitalise a string.
@@ -31,6 +33,7 @@ def Capitalize(v: str) -> str:
     'Hello world'
     """
     return str(v).capitalize()
+Capitalize._voluptuous_pure = True  # type: ignore[attr-defined]
 
 def Title(v: str) -> str:
     """Title case a string.
@@ -40,6 +43,7 @@ def Title(v: str) -> str:
     'Hello World'
     """
     return str(v).title()
+Title._voluptuous_pure = True  # type: ignore[attr-defined]
 
 def Strip(v: str) -> str:
     """Strip whitespace from a string.
@@ -49,6 +53,7 @@ def Strip(v: str) -> str:
     'hello world'
     """
     return str(v).strip()
+Strip._voluptuous_pure = True  # type: ignore[attr-defined]
 
 class DefaultTo(object):
     """Sets a value to default_value if none provided.
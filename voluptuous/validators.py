@@ -205,7 +205,7 @@ class _WithSubValidators(object):
 
     def _run(self, path, data):
         """Run the compiled validators."""
-        return self._exec(self._compiled, data)
+        return self._exec(self._compiled, data, path)
 
     def __call__(self, v):
         return self._exec((Schema(val) for val in self.validators), v)
@@ -213,8 +213,12 @@ class _WithSubValidators(object):
     def __repr__(self):
         return '%s(%s, msg=%r)' % (self.__class__.__name__, ', '.join((repr(v) for v in self.validators)), self.msg)
 
-    def _exec(self, validators, v):
-        """Execute the validators against the value."""
+    def _exec(self, validators, v, path=None):
+        """Execute the validators against the value.
+
+        Compiled validators are called with ``path``; when called directly,
+        ``path`` is None and ``validators`` are Schema instances.
+        """
         raise NotImplementedError
 
 class Any(_WithSubValidators):
@@ -242,16 +246,18 @@ class Any(_WithSubValidators):
     ...   validate(4)
     """
 
-    def _exec(self, validators, v):
-        errors = []
+    def _exec(self, validators, v, path=None):
+        error = None
         for validator in validators:
             try:
-                return validator(v)
+                return validator(v) if path is None else validator(path, v)
             except Invalid as e:
-                errors.append(e)
-        if len(errors) == 1:
-            raise errors[0]
-        raise AnyInvalid(self.msg or 'no valid value found')
+                # Report the alternative that got furthest into the value
+                if error is None or len(e.path) > len(error.path):
+                    error = e
+        if error is not None and self.msg is None:
+            raise error
+        raise AnyInvalid(self.msg or 'no valid value found', path)
 Or = Any
 
 class Union(_WithSubValidators):
@@ -275,9 +281,9 @@ class Union(_WithSubValidators):
     Without the discriminant, the exception would be "extra keys not allowed @ data['b_val']"
     """
 
-    def _exec(self, validators, v):
+    def _exec(self, validators, v, path=None):
         if self.discriminant is None:
-            return Any._exec(self, validators, v)
+            return Any._exec(self, validators, v, path)
         
         filtered = list(self.discriminant(v, [val.schema for val in validators]))
         if not filtered:
@@ -315,12 +321,12 @@ class SomeOf(_WithSubValidators):
         self.min_valid = min_valid
         self.max_valid = max_valid
 
-    def _exec(self, validators, v):
+    def _exec(self, validators, v, path=None):
         valid = []
         errors = []
         for validator in validators:
             try:
-                valid.append(validator([], v))
+                valid.append(validator(v) if path is None else validator(path, v))
             except Invalid as e:
                 errors.append(e)
 
@@ -344,19 +350,15 @@ class All(_WithSubValidators):
     10
     """
 
-    def _exec(self, validators, v):
-        value = v
-        errors = []
-        for validator in validators:
-            try:
-                value = validator(value)
-            except Invalid as e:
-                errors.append(e)
-        if errors:
-            if len(errors) == 1:
-                raise errors[0]
-            raise AllInvalid(self.msg or 'value did not pass all validators')
-        return value
+    def _exec(self, validators, v, path=None):
+        try:
+            for validator in validators:
+                v = validator(v) if path is None else validator(path, v)
+        except Invalid as e:
+            if self.msg is None:
+                raise
+            raise AllInvalid(self.msg, path)
+        return v
 And = All
 
 class Match(object):
@@ -454,7 +456,7 @@ def Email(v=None):
 
     if v is None:
         return validate_email
-    return validate_email([], v)
+    return validate_email((), v)
 
 @message('expected a fully qualified domain name URL', cls=UrlInvalid)
 def FqdnUrl(v=None):
@@ -485,7 +487,7 @@ def FqdnUrl(v=None):
 
     if v is None:
         return validate_fqdn_url
-    return validate_fqdn_url([], v)
+    return validate_fqdn_url((), v)
 
 @message('expected a URL', cls=UrlInvalid)
 def Url(v=None):
@@ -934,7 +936,7 @@ class Unordered(object):
             el = missing[0]
             raise Invalid(self.msg or 'Element #{} ({}) is not valid against any validator'.format(el[0], el[1]))
         elif missing:
-            raise MultipleInvalid([Invalid(self.msg or 'Element #{} ({}) is not valid against any validator'.format(el[0], el[1])) for el in missing])
+            raise MultipleInvalid([Invalid(self.msg or 'Element #{} ({}) is not valid against any validator'.format(el[0], el[1])) for el in missing], _own=True)
         return v
 
     def __repr__(self):